@@ -0,0 +1,630 @@
+# benchmarks/fake_services.py
+"""
+Lokale Stand-ins für alle externen Dienste des Bots: Solana RPC + WebSocket,
+DexScreener, GoPlus, CoinGecko, Telegram (HTTP), Redis (RESP über TCP) und Firestore.
+
+HTTP, WebSocket und Redis laufen in einem eigenen Prozess und teilen sich einen
+synthetischen Markt (`Market`), der neue Pools
+erzeugt, Preisverläufe skriptet und die Zeitpunkte aller beobachteten Ereignisse
+für die Benchmark-Auswertung festhält.
+"""
+import asyncio
+import itertools
+import json
+import multiprocessing
+import random
+import resource
+import time
+from collections import defaultdict, deque
+from aiohttp import web, WSMsgType
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+RAYDIUM_LP_V4 = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
+RAYDIUM_AUTHORITY_V4 = "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"
+SOL_MINT_ADDRESS = "So11111111111111111111111111111111111111112"
+TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+SOL_PRICE_USD = 150.0
+POOL_SOL_BALANCE = 100.0      # 100 SOL * $150 * 2 = $30.000 -> besteht den Gatekeeper
+LOW_POOL_SOL_BALANCE = 10.0   # $3.000 -> fällt am Liquiditäts-Check durch
+START_PRICE_USD = 0.001
+MAX_PROGRAM_SIGNATURES = 1000
+
+def _new_address():
+    return str(Pubkey.new_unique())
+
+class FaultInjector:
+    """Künstliche Latenz und Fehlerquote für einen Dienst."""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+
+    async def delay(self):
+        self.requests += 1
+        latency = self.latency_ms + (self.rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+    def should_fail(self):
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.errors += 1
+            return True
+        return False
+
+    def stats(self):
+        return {"requests": self.requests, "errors": self.errors}
+
+class Market:
+    """
+    Synthetischer Solana-Markt: Pools, Transaktionen, geskriptete Preisverläufe
+    und ein Ereignisprotokoll (Ereignis -> Schlüssel -> monotone Zeit).
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.rng = random.Random(profile.seed)
+        self.pools = {}                 # token_address -> Pool-Daten
+        self.token_by_account = {}      # Vault-Konto -> (token_address, Balance)
+        self.transactions = {}          # Signatur -> getTransaction-Ergebnis (nur noch erreichbare)
+        self.confirmed_at = {}          # Signatur -> monotone Zeit der Bestätigung
+        self.pool_by_signature = {}     # initialize2-Signatur -> token_address (nur Pools über der Mindestliquidität)
+        self.slots = itertools.count(1)
+        self.program_signatures = deque(maxlen=MAX_PROGRAM_SIGNATURES)
+        self.insider_wallet = _new_address()
+        self.watched_tokens = []
+        self.events = defaultdict(dict)
+
+    def record(self, kind: str, key: str):
+        self.events[kind].setdefault(key, time.monotonic())
+
+    def _create_pool(self, low_liquidity: bool = False):
+        token_address = _new_address()
+        pool = {
+            "amm": _new_address(),
+            "coin_vault": _new_address(),
+            "pc_vault": _new_address(),
+            "lp_mint": _new_address(),
+            "hot": False,
+            "price_path": [(0, 1.0)],     # (Sekunden nach dem Insider-Kauf, Preis relativ zu START_PRICE_USD)
+            "path_started_at": None,
+            "low_liquidity": low_liquidity,
+        }
+        self.pools[token_address] = pool
+        self.token_by_account[pool["coin_vault"]] = (token_address, 1_000_000_000.0, 6)
+        self.token_by_account[pool["pc_vault"]] = (SOL_MINT_ADDRESS, LOW_POOL_SOL_BALANCE if low_liquidity else POOL_SOL_BALANCE, 9)
+        return token_address, pool
+
+    def _add_transaction(self, account_keys: list, logs: list, pre_token_balances=(), post_token_balances=()):
+        signature = str(Signature.new_unique())
+        self.transactions[signature] = {
+            "slot": next(self.slots),
+            "blockTime": int(time.time()),
+            "version": 0,
+            "transaction": {
+                "signatures": [signature],
+                "message": {
+                    "header": {"numRequiredSignatures": 1, "numReadonlySignedAccounts": 0, "numReadonlyUnsignedAccounts": 1},
+                    "accountKeys": account_keys,
+                    "recentBlockhash": _new_address(),
+                    "instructions": [{"programIdIndex": len(account_keys) - 1, "accounts": list(range(len(account_keys) - 1)), "data": "", "stackHeight": None}],
+                    "addressTableLookups": [],
+                },
+            },
+            "meta": {
+                "err": None, "status": {"Ok": None}, "fee": 5000,
+                "preBalances": [0] * len(account_keys), "postBalances": [0] * len(account_keys),
+                "innerInstructions": [], "logMessages": logs,
+                "preTokenBalances": list(pre_token_balances), "postTokenBalances": list(post_token_balances),
+                "rewards": [], "loadedAddresses": {"writable": [], "readonly": []}, "computeUnitsConsumed": 50000,
+            },
+        }
+        self.confirmed_at[signature] = time.monotonic()
+        return signature
+
+    def is_visible(self, signature: str, commitment: str):
+        """Bestätigte Transaktionen sind sofort abrufbar, finalisierte erst nach der Finalisierungsverzögerung."""
+        confirmed_at = self.confirmed_at.get(signature)
+        if confirmed_at is None:
+            return False
+        if commitment in ("processed", "confirmed"):
+            return True
+        return time.monotonic() >= confirmed_at + self.profile.finalization_delay
+
+    def _publish(self, signature: str):
+        """Hängt eine Programm-Signatur an; was aus dem Fenster fällt, ist nicht mehr abrufbar und wird verworfen."""
+        if len(self.program_signatures) == self.program_signatures.maxlen:
+            self.transactions.pop(self.program_signatures[0], None)
+            self.confirmed_at.pop(self.program_signatures[0], None)
+            self.pool_by_signature.pop(self.program_signatures[0], None)
+        self.program_signatures.append(signature)
+
+    def create_storm_pool(self):
+        """Erzeugt einen neuen Raydium-Pool samt initialize2-Transaktion."""
+        low_liquidity = self.rng.random() < self.profile.low_liquidity_ratio
+        token_address, pool = self._create_pool(low_liquidity)
+        logs = [
+            f"Program {RAYDIUM_LP_V4} invoke [1]",
+            f"Program log: initialize2 {pool['amm']} {pool['coin_vault']} {pool['pc_vault']} {pool['lp_mint']} {token_address} {SOL_MINT_ADDRESS}",
+            f"Program {RAYDIUM_LP_V4} success",
+        ]
+        signature = self._add_transaction([_new_address(), pool["amm"], RAYDIUM_LP_V4], logs)
+        self._publish(signature)
+        if not low_liquidity:
+            self.pool_by_signature[signature] = token_address
+            self.record("pool_created", token_address)
+
+    def create_noise_swap(self):
+        """Gewöhnlicher Swap auf dem Raydium-Programm, den der Gatekeeper ebenfalls laden muss."""
+        logs = [f"Program {RAYDIUM_LP_V4} invoke [1]", "Program log: ray_log: swap", f"Program {RAYDIUM_LP_V4} success"]
+        self._publish(self._add_transaction([_new_address(), RAYDIUM_LP_V4], logs))
+
+    def create_watched_token(self, price_path: list):
+        token_address, pool = self._create_pool()
+        pool["trigger_at"] = None
+        pool["price_path"] = sorted((float(offset), float(multiplier)) for offset, multiplier in price_path)
+        self.watched_tokens.append(token_address)
+        return token_address
+
+    def create_insider_swap(self, token_address: str):
+        """Swap, bei dem die Insider-Wallet den Token kauft (für den Swap-Stream)."""
+        pool = self.pools[token_address]
+        buyer_account = _new_address()
+
+        def balance(owner, account_index, amount):
+            return {"accountIndex": account_index, "mint": token_address, "owner": owner, "programId": TOKEN_PROGRAM,
+                    "uiTokenAmount": {"amount": str(amount), "decimals": 6, "uiAmount": amount / 1e6, "uiAmountString": str(amount / 1e6)}}
+
+        logs = [f"Program {RAYDIUM_LP_V4} invoke [1]", "Program log: ray_log: swap", f"Program {RAYDIUM_LP_V4} success"]
+        return self._add_transaction(
+            [self.insider_wallet, buyer_account, pool["coin_vault"], pool["amm"], RAYDIUM_LP_V4],
+            logs,
+            pre_token_balances=[balance(self.insider_wallet, 1, 0), balance(RAYDIUM_AUTHORITY_V4, 2, 10**12)],
+            post_token_balances=[balance(self.insider_wallet, 1, 5 * 10**9), balance(RAYDIUM_AUTHORITY_V4, 2, 10**12 - 5 * 10**9)],
+        )
+
+    def pair_data(self, token_address: str):
+        pool = self.pools.get(token_address)
+        if not pool:
+            return None
+        price = START_PRICE_USD
+        if pool["path_started_at"] is not None:
+            elapsed = time.monotonic() - pool["path_started_at"]
+            price *= next((multiplier for offset, multiplier in reversed(pool["price_path"]) if offset <= elapsed), 1.0)
+        if pool["hot"]:
+            txns, volume_h1 = {"buys": 900, "sells": 100}, 50000
+        else:
+            txns, volume_h1 = {"buys": 20, "sells": 20}, 500
+        return {
+            "chainId": "solana",
+            "dexId": "raydium",
+            "pairAddress": pool["amm"],
+            "baseToken": {"address": token_address},
+            "quoteToken": {"address": SOL_MINT_ADDRESS},
+            "priceUsd": f"{price:.10f}",
+            "txns": {"h24": txns},
+            "volume": {"h1": volume_h1},
+        }
+
+class FakeRedis:
+    """Minimaler RESP-Server für die Set- und Hash-Befehle, die der DatabaseManager nutzt."""
+
+    def __init__(self, market: Market, injector: FaultInjector):
+        self.market = market
+        self.injector = injector
+        self.sets = defaultdict(set)
+        self.hashes = defaultdict(dict)
+        self.writers = set()
+
+    async def _read_command(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.decode().split()
+        args = []
+        for _ in range(int(line[1:])):
+            length = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(length + 2))[:-2].decode())
+        return args
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bool):
+            return b":%d\r\n" % int(value)
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, dict): # RESP3-Map (per HELLO ausgehandelt)
+            items = [item.encode() for pair in value.items() for item in pair]
+            return b"%%%d\r\n" % len(value) + b"".join(b"$%d\r\n%s\r\n" % (len(item), item) for item in items)
+        if isinstance(value, (list, set)):
+            items = [member.encode() for member in value]
+            return b"*%d\r\n" % len(items) + b"".join(b"$%d\r\n%s\r\n" % (len(item), item) for item in items)
+        return value
+
+    def execute(self, args):
+        command, key, members = args[0].upper(), (args[1] if len(args) > 1 else None), args[2:]
+        if command == "PING":
+            return b"+PONG\r\n"
+        if command == "SADD":
+            added = [m for m in members if m not in self.sets[key]]
+            self.sets[key].update(added)
+            if key == "hot_watchlist":
+                for member in added:
+                    self.market.record("watchlisted", member)
+            return len(added)
+        if command == "SREM":
+            removed = [m for m in members if m in self.sets[key]]
+            self.sets[key].difference_update(removed)
+            return len(removed)
+        if command == "SMEMBERS":
+            return set(self.sets[key])
+        if command == "SISMEMBER":
+            return members[0] in self.sets[key]
+        if command == "HSET":
+            added = [field for field in members[::2] if field not in self.hashes[key]]
+            self.hashes[key].update(zip(members[::2], members[1::2]))
+            return len(added)
+        if command == "HDEL":
+            return len([field for field in members if self.hashes[key].pop(field, None) is not None])
+        if command == "HGETALL":
+            return dict(self.hashes[key])
+        if command == "HELLO": # redis-py verhandelt RESP3, die Antworten unten sind in beiden Protokollen gültig
+            return b"%2\r\n$6\r\nserver\r\n$5\r\nredis\r\n$5\r\nproto\r\n:3\r\n"
+        if command in ("CLIENT", "SELECT"):
+            return b"+OK\r\n"
+        return b"-ERR unknown command '%s'\r\n" % command.encode()
+
+    async def handle(self, reader, writer):
+        self.writers.add(writer)
+        try:
+            while (args := await self._read_command(reader)) is not None:
+                if not args:
+                    continue
+                await self.injector.delay()
+                if self.injector.should_fail():
+                    writer.write(b"-ERR injected failure\r\n")
+                else:
+                    writer.write(self._encode(self.execute(args)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    async def close_connections(self):
+        """Schließt offene Client-Verbindungen, damit die Handler regulär enden."""
+        for writer in list(self.writers):
+            writer.close()
+        while self.writers:
+            await asyncio.sleep(0.01)
+
+class _FakeDocument:
+    def __init__(self, store: "FakeFirestoreClient", collection: str, document_id: str):
+        self.store, self.collection, self.document_id = store, collection, document_id
+
+    async def set(self, data: dict):
+        await self.store.injector.delay()
+        if self.store.injector.should_fail():
+            raise RuntimeError("Injected Firestore failure")
+        self.store.documents[self.collection][self.document_id] = dict(data)
+        if self.collection == "portfolio":
+            kind = "buy" if data.get("status") == "open" else "sell"
+            self.store.events[kind].setdefault(self.document_id, time.monotonic())
+            if kind == "sell":
+                exit_kind = "take_profit" if str(data.get("exit_reason", "")).startswith("Take Profit") else "stop_loss"
+                self.store.events[exit_kind].setdefault(self.document_id, time.monotonic())
+
+class _FakeSnapshot:
+    def __init__(self, data: dict):
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+class _FakeCollection:
+    def __init__(self, store: "FakeFirestoreClient", name: str):
+        self.store, self.name = store, name
+
+    def document(self, document_id: str):
+        return _FakeDocument(self.store, self.name, document_id)
+
+    async def stream(self):
+        await self.store.injector.delay()
+        if self.store.injector.should_fail():
+            raise RuntimeError("Injected Firestore failure")
+        for data in list(self.store.documents[self.name].values()):
+            yield _FakeSnapshot(data)
+
+class FakeFirestoreClient:
+    """
+    In-Process-Ersatz für firestore.AsyncClient (collection/document/set/stream).
+    Der echte Firestore-Emulator spricht gRPC, daher wird der Client direkt ersetzt;
+    er läuft als einziger Stand-in im Bot-Prozess.
+    """
+
+    def __init__(self, injector: FaultInjector):
+        self.injector = injector
+        self.documents = defaultdict(dict)
+        self.events = defaultdict(dict)
+
+    def collection(self, name: str):
+        return _FakeCollection(self, name)
+
+SERVICES = ("rpc", "ws", "dexscreener", "goplus", "coingecko", "telegram", "redis", "firestore")
+
+def _build_injector(profile, name: str):
+    latency = profile.service_latency_ms.get(name, profile.latency_ms)
+    error_rate = profile.service_error_rate_map.get(name, profile.error_rate)
+    return FaultInjector(latency, profile.jitter_ms, error_rate, seed=profile.seed + SERVICES.index(name))
+
+class StandInServer:
+    """HTTP-, WebSocket- und Redis-Stand-ins samt Lastgeneratoren; läuft im Kindprozess."""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.market = Market(profile)
+        self.injectors = {name: _build_injector(profile, name) for name in SERVICES if name != "firestore"}
+        self.redis = FakeRedis(self.market, self.injectors["redis"])
+        self.subscriptions = {}   # Subscription-ID -> (WebSocket, AMM-Konto)
+        self.next_subscription_id = 1
+        self._background = set()
+
+    # --- HTTP-Handler -----------------------------------------------------
+
+    @web.middleware
+    async def _fault_middleware(self, request, handler):
+        service = request.path.strip("/").split("/")[0]
+        injector = self.injectors.get(service) if service != "ws" else None # WebSocket: pro Nachricht, siehe unten
+        if injector:
+            await injector.delay()
+            if injector.should_fail():
+                return web.json_response({"error": "injected failure"}, status=500)
+        return await handler(request)
+
+    async def _rpc(self, request):
+        body = await request.json()
+        method, params = body.get("method"), body.get("params", [])
+        config = params[1] if len(params) > 1 and isinstance(params[1], dict) else {}
+        commitment = config.get("commitment", "finalized") # Standard des Knotens
+        result = None
+        if method == "getSignaturesForAddress":
+            limit = config.get("limit", 1000)
+            signatures = [s for s in self.market.program_signatures if self.market.is_visible(s, commitment)][-limit:]
+            result = [{"signature": s, "slot": self.market.transactions[s]["slot"], "err": None, "memo": None,
+                       "blockTime": self.market.transactions[s]["blockTime"],
+                       "confirmationStatus": "finalized" if self.market.is_visible(s, "finalized") else "confirmed"}
+                      for s in reversed(signatures)]
+        elif method == "getTransaction":
+            if self.market.is_visible(params[0], commitment):
+                result = self.market.transactions.get(params[0])
+                if result and params[0] in self.market.pool_by_signature:
+                    # Erkennung = der Bot lädt die initialize2-Transaktion zum ersten Mal
+                    self.market.record("pool_detected", self.market.pool_by_signature[params[0]])
+        elif method == "getTokenAccountBalance":
+            entry = self.market.token_by_account.get(params[0])
+            if entry is None:
+                return web.json_response({"jsonrpc": "2.0", "id": body.get("id"), "error": {"code": -32602, "message": "could not find account"}})
+            _, ui_amount, decimals = entry
+            result = {"context": {"slot": 1}, "value": {"amount": str(int(ui_amount * 10**decimals)), "decimals": decimals,
+                                                         "uiAmount": ui_amount, "uiAmountString": str(ui_amount)}}
+        return web.json_response({"jsonrpc": "2.0", "id": body.get("id"), "result": result})
+
+    async def _websocket(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        injector = self.injectors["ws"]
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                body = json.loads(message.data)
+                await injector.delay()
+                if injector.should_fail():
+                    await ws.send_json({"jsonrpc": "2.0", "id": body.get("id"), "error": {"code": -32603, "message": "injected failure"}})
+                elif body.get("method") == "logsSubscribe":
+                    subscription_id = self.next_subscription_id
+                    self.next_subscription_id += 1
+                    amm = body["params"][0]["mentions"][0]
+                    self.subscriptions[subscription_id] = (ws, amm)
+                    await ws.send_json({"jsonrpc": "2.0", "id": body["id"], "result": subscription_id})
+                elif body.get("method") == "logsUnsubscribe":
+                    found = self.subscriptions.pop(body["params"][0], None) is not None
+                    await ws.send_json({"jsonrpc": "2.0", "id": body["id"], "result": found})
+        finally:
+            for subscription_id in [s for s, (owner, _) in self.subscriptions.items() if owner is ws]:
+                del self.subscriptions[subscription_id]
+        return ws
+
+    async def _dexscreener(self, request):
+        # Wie die echte API: bis zu 30 kommagetrennte Adressen pro Anfrage
+        pairs = [pair for token in request.match_info["token"].split(",")[:30] if (pair := self.market.pair_data(token))]
+        return web.json_response({"schemaVersion": "1.0.0", "pairs": pairs or None})
+
+    async def _goplus(self, request):
+        token_address = request.query.get("contract_addresses", "")
+        return web.json_response({"code": 1, "result": {token_address.lower(): {"top_10_holder_rate": "0.12"}}})
+
+    async def _coingecko(self, request):
+        return web.json_response({"solana": {"usd": SOL_PRICE_USD}})
+
+    async def _telegram(self, request):
+        await request.json()
+        return web.json_response({"ok": True, "result": {}})
+
+    # --- Lastgeneratoren --------------------------------------------------
+
+    async def _pool_storm(self, started_at: float):
+        profile = self.profile
+        total_pools = int(profile.pools_per_second * profile.duration)
+        total_noise = int(profile.noise_swaps_per_second * profile.duration)
+        schedule = sorted([(i / profile.pools_per_second, "pool") for i in range(total_pools)] +
+                          [(i / profile.noise_swaps_per_second, "noise") for i in range(total_noise)])
+        for offset, kind in schedule:
+            delay = started_at + offset - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if kind == "pool":
+                self.market.create_storm_pool()
+            else:
+                self.market.create_noise_swap()
+
+    async def _notify(self, ws, subscription_id: int, token_address: str, signature: str):
+        """Stellt eine logsNotification zu - verzögert oder (bei Fehlerinjektion) verworfen."""
+        injector = self.injectors["ws"]
+        await injector.delay()
+        if injector.should_fail():
+            self.market.record("notification_dropped", token_address)
+            return
+        try:
+            await ws.send_json({"jsonrpc": "2.0", "method": "logsNotification", "params": {
+                "subscription": subscription_id,
+                "result": {"context": {"slot": 1}, "value": {"signature": signature, "err": None, "logs": []}},
+            }})
+        except ConnectionError:
+            pass
+
+    async def _emit_triggers(self):
+        """Erzeugt die Insider-Swaps der beobachteten Token, sobald ihr Trigger-Zeitpunkt erreicht ist."""
+        pending = list(self.market.watched_tokens)
+        while pending:
+            now = time.monotonic()
+            for token_address in list(pending):
+                pool = self.market.pools[token_address]
+                if pool["trigger_at"] is None or now < pool["trigger_at"]:
+                    continue
+                listeners = [(s, ws) for s, (ws, amm) in self.subscriptions.items() if amm == pool["amm"]]
+                if not listeners:
+                    continue # Swap-Stream hat den Pool noch nicht abonniert
+                signature = self.market.create_insider_swap(token_address)
+                pool["hot"] = True
+                pool["path_started_at"] = now
+                self.market.record("trigger", token_address)
+                for subscription_id, ws in listeners:
+                    task = asyncio.create_task(self._notify(ws, subscription_id, token_address, signature))
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+                pending.remove(token_address)
+            await asyncio.sleep(0.01)
+
+    # --- Lebenszyklus -----------------------------------------------------
+
+    async def serve(self, conn):
+        """Startet die Server, meldet die Ports und folgt den Befehlen des Bot-Prozesses."""
+        loop = asyncio.get_running_loop()
+        app = web.Application(middlewares=[self._fault_middleware])
+        app.router.add_post("/rpc", self._rpc)
+        app.router.add_get("/ws", self._websocket)
+        app.router.add_get("/dexscreener/{token}", self._dexscreener)
+        app.router.add_get("/goplus", self._goplus)
+        app.router.add_get("/coingecko", self._coingecko)
+        app.router.add_post("/telegram/{bot}/sendMessage", self._telegram)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        redis_server = await asyncio.start_server(self.redis.handle, "127.0.0.1", 0)
+
+        for index in range(self.profile.watched_tokens):
+            token_address = self.market.create_watched_token(self.profile.price_paths[index % len(self.profile.price_paths)])
+            self.redis.sets["hot_watchlist"].add(token_address)
+            self.redis.hashes["hot_watchlist_pools"][token_address] = self.market.pools[token_address]["amm"]
+        self.redis.sets["insider_wallets"].add(self.market.insider_wallet)
+        conn.send(("ready", runner.addresses[0][1], redis_server.sockets[0].getsockname()[1], self.market.watched_tokens))
+
+        tasks = []
+        try:
+            while True:
+                command, *payload = await loop.run_in_executor(None, conn.recv)
+                if command == "begin":
+                    started_at, = payload
+                    for index, token_address in enumerate(self.market.watched_tokens):
+                        self.market.pools[token_address]["trigger_at"] = started_at + self.profile.trigger_after + index * self.profile.trigger_stagger
+                    tasks = [asyncio.create_task(self._pool_storm(started_at)), asyncio.create_task(self._emit_triggers())]
+                elif command == "stop":
+                    break
+        finally:
+            for task in tasks + list(self._background):
+                task.cancel()
+            redis_server.close()
+            await asyncio.wait_for(self.redis.close_connections(), timeout=5)
+            await runner.cleanup()
+        conn.send(("result", dict(self.market.events), {name: i.stats() for name, i in self.injectors.items()},
+                   round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)))
+
+def _run_stand_ins(profile, conn):
+    asyncio.run(StandInServer(profile).serve(conn))
+
+class FakeServices:
+    """
+    Steuert die Stand-ins aus dem Bot-Prozess: HTTP/WebSocket/Redis laufen in einem
+    eigenen Prozess, damit weder ihr Speicher noch ihre CPU-Zeit (GIL) in die
+    Messwerte des Bots einfließen. Nur der Firestore-Client lebt im Bot-Prozess.
+    """
+
+    SERVICES = SERVICES
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.firestore_injector = _build_injector(profile, "firestore")
+        self.firestore = FakeFirestoreClient(self.firestore_injector)
+        self.http_port = None
+        self.redis_port = None
+        self.watched_tokens = []
+        self.events = defaultdict(dict)
+        self.stats = {}
+        self.stand_ins_peak_rss_mb = None
+        self._conn = None
+        self._process = None
+
+    def start(self):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_run_stand_ins, args=(self.profile, child_conn), name="chimera-stand-ins", daemon=True)
+        self._process.start()
+        _, self.http_port, self.redis_port, self.watched_tokens = self._conn.recv()
+
+    def begin_load(self):
+        """Startet Pool-Sturm und Trigger-Skript. CLOCK_MONOTONIC ist prozessübergreifend vergleichbar."""
+        started_at = time.monotonic()
+        self._conn.send(("begin", started_at))
+        return started_at
+
+    def stop(self):
+        """Beendet den Stand-in-Prozess und führt seine Ereignisse mit denen des Firestore-Stand-ins zusammen."""
+        if not self._process or not self._process.is_alive():
+            return
+        self._conn.send(("stop",))
+        if self._conn.poll(30):
+            _, events, self.stats, self.stand_ins_peak_rss_mb = self._conn.recv()
+            for kind, entries in events.items():
+                self.events[kind].update(entries)
+        self._process.join(timeout=10)
+        if self._process.is_alive():
+            self._process.terminate()
+        for kind, entries in self.firestore.events.items():
+            self.events[kind].update(entries)
+        self.stats["firestore"] = self.firestore_injector.stats()
+
+    def environment(self):
+        """Umgebungsvariablen, die den Bot auf die Stand-ins umleiten."""
+        http = f"http://127.0.0.1:{self.http_port}"
+        redis_url = f"redis://127.0.0.1:{self.redis_port}/0"
+        return {
+            "QUICKNODE_RPC_URL": f"{http}/rpc",
+            "QUICKNODE_WSS_URL": f"ws://127.0.0.1:{self.http_port}/ws",
+            "DEXSCREENER_API_URL": f"{http}/dexscreener",
+            "GOPLUS_API_URL": f"{http}/goplus",
+            "COINGECKO_API_URL": f"{http}/coingecko",
+            "TELEGRAM_API_URL": f"{http}/telegram",
+            "TELEGRAM_BOT_TOKEN": "benchmark",
+            "TELEGRAM_CHAT_ID": "benchmark",
+            "GOOGLE_CLOUD_PROJECT": "benchmark",
+            "GOOGLE_CREDENTIALS_BASE64": "YmVuY2htYXJr", # Absichtlich ungültig -> Firestore-Stand-in wird injiziert
+            "REDIS_URL": redis_url,
+            "UPSTASH_REDIS_URL": redis_url,
+        }
@@ -0,0 +1,224 @@
+# benchmarks/pool_storm.py
+"""
+Synthetischer Pool-Sturm: treibt Gatekeeper, Trigger Watcher, Swap-Stream und
+Athena unverändert gegen lokale Stand-in-Server und misst den Durchsatz.
+
+Aufruf (aus dem Repository-Root):
+    python -m benchmarks.pool_storm --pools-per-second 10 --duration 30 --interval-scale 0.05 --output bench.json
+
+Das Ergebnis ist ein JSON-Dokument (stdout oder --output), Logs gehen nach stderr.
+"""
+import argparse
+import asyncio
+import bisect
+import contextlib
+import importlib
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+from .fake_services import FakeServices, START_PRICE_USD
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _service_overrides(values, cast):
+    overrides = {}
+    for value in values or []:
+        name, _, amount = value.partition("=")
+        if name not in FakeServices.SERVICES or not amount:
+            raise argparse.ArgumentTypeError(f"Ungültige Dienst-Angabe '{value}', erwartet z.B. dexscreener=50")
+        overrides[name] = cast(amount)
+    return overrides
+
+def _price_path(spec: str, args):
+    """Preset (crash, moon, fade, flat) oder eigener Verlauf 'Sekunden:Faktor,...' ab dem Insider-Kauf."""
+    presets = {
+        "crash": [(0, 1.0), (args.crash_after, args.crash_factor)],
+        "moon": [(0, 1.0), (args.crash_after / 2, 1.8), (args.crash_after, 3.0)],
+        "fade": [(args.crash_after * step / 5, 1 - (1 - args.crash_factor) * step / 5) for step in range(6)],
+        "flat": [(0, 1.0)],
+    }
+    if spec in presets:
+        return presets[spec]
+    try:
+        path = [(float(offset), float(multiplier)) for offset, _, multiplier in (point.partition(":") for point in spec.split(","))]
+    except ValueError:
+        path = None
+    if not path or any(multiplier <= 0 for _, multiplier in path):
+        raise argparse.ArgumentTypeError(f"Ungültiger Preisverlauf '{spec}', erwartet {'/'.join(presets)} oder z.B. 0:1,10:2.6")
+    return sorted(path)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pool-Sturm Lastgenerator und End-to-End-Durchsatz-Benchmark.")
+    parser.add_argument("--pools-per-second", type=float, default=5, help="Neue initialize2-Pools pro Sekunde")
+    parser.add_argument("--noise-swaps-per-second", type=float, default=0, help="Gewöhnliche Raydium-Swaps pro Sekunde")
+    parser.add_argument("--duration", type=float, default=120, help="Dauer des Pool-Sturms in Sekunden")
+    parser.add_argument("--drain", type=float, default=90, help="Nachlaufzeit nach dem Sturm in Sekunden")
+    parser.add_argument("--low-liquidity-ratio", type=float, default=0.2, help="Anteil der Pools, die am Liquiditäts-Check scheitern")
+    parser.add_argument("--watched-tokens", type=int, default=10, help="Token mit geskriptetem Preisverlauf auf der Hot Watchlist")
+    parser.add_argument("--trigger-after", type=float, default=10, help="Sekunden bis zum ersten Insider-Kauf")
+    parser.add_argument("--trigger-stagger", type=float, default=2, help="Abstand zwischen den Insider-Käufen in Sekunden")
+    parser.add_argument("--price-path", action="append", metavar="VERLAUF",
+                        help="Preisverlauf der beobachteten Token (crash, moon, fade, flat oder 0:1,10:2.6); mehrfach angegeben reihum verteilt")
+    parser.add_argument("--crash-after", type=float, default=15, help="Dauer der Presets in Sekunden nach dem Insider-Kauf")
+    parser.add_argument("--crash-factor", type=float, default=0.4, help="Endpreis der Presets crash/fade relativ zum Einstieg")
+    parser.add_argument("--finalization-delay", type=float, default=13, help="Sekunden von confirmed bis finalized (getTransaction ohne Commitment)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Künstliche Latenz aller Stand-ins")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Zusätzliche zufällige Latenz (0..jitter)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fehlerquote aller Stand-ins (0..1)")
+    parser.add_argument("--service-latency", action="append", metavar="DIENST=MS", help="Latenz pro Dienst, z.B. rpc=80")
+    parser.add_argument("--service-error-rate", action="append", metavar="DIENST=QUOTE", help="Fehlerquote pro Dienst, z.B. dexscreener=0.05")
+    parser.add_argument("--interval-scale", type=float, default=1.0, help="Faktor für alle Polling-Intervalle der Services")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="Pfad für das JSON-Ergebnis (Standard: stdout)")
+    args = parser.parse_args(argv)
+    args.service_latency_ms = _service_overrides(args.service_latency, float)
+    args.service_error_rate_map = _service_overrides(args.service_error_rate, float)
+    args.price_paths = [_price_path(spec, args) for spec in args.price_path or ["crash"]]
+    return args
+
+def _percentiles(samples):
+    if not samples:
+        return {"count": 0, "p50": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+
+    def rank(p): # Nearest-Rank-Methode
+        return round(ordered[max(0, math.ceil(p * len(ordered)) - 1)] * 1000, 2)
+
+    return {"count": len(ordered), "p50": rank(0.50), "p99": rank(0.99), "max": round(ordered[-1] * 1000, 2)}
+
+def _latencies(start_events: dict, end_events: dict):
+    return [end_events[key] - started for key, started in start_events.items() if key in end_events]
+
+def _exits_due(args, fakes: FakeServices, athena):
+    """
+    Zeitpunkt, ab dem Athena laut Preisverlauf verkaufen muss (Take Profit / Stop Loss),
+    gemessen gegen den tatsächlichen Einstiegspreis und frühestens ab dem Kauf.
+    """
+    events, due = fakes.events, {"take_profit": {}, "stop_loss": {}}
+    for index, token_address in enumerate(fakes.watched_tokens):
+        position = fakes.firestore.documents["portfolio"].get(token_address)
+        if token_address not in events["trigger"] or token_address not in events["buy"] or not position:
+            continue
+        entry_multiplier = float(position.get("entry_price_usd") or 0) / START_PRICE_USD
+        if entry_multiplier <= 0:
+            continue
+        path = args.price_paths[index % len(args.price_paths)]
+        bought_after = events["buy"][token_address] - events["trigger"][token_address]
+        # Punkte vor dem Kauf sind im Einstiegspreis bereits enthalten
+        first = max(0, bisect.bisect_right([offset for offset, _ in path], bought_after) - 1)
+        for offset, multiplier in path[first:]:
+            pnl_percent = (multiplier - entry_multiplier) / entry_multiplier * 100
+            kind = ("take_profit" if pnl_percent >= athena.TAKE_PROFIT_PERCENT else
+                    "stop_loss" if pnl_percent <= athena.STOP_LOSS_PERCENT else None)
+            if kind:
+                due[kind][token_address] = events["trigger"][token_address] + max(offset, bought_after)
+                break
+    return due
+
+def _peak_rss_mb():
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1) # Linux: KiB
+
+def _import_bot(args, workdir: str):
+    """Importiert die Bot-Services erst, nachdem die Umgebung auf die Stand-ins zeigt."""
+    sys.path.insert(0, REPO_ROOT)
+    os.chdir(workdir) # Bot-Logdatei nicht ins Repository schreiben
+    with contextlib.redirect_stdout(sys.stderr): # stdout bleibt dem JSON-Ergebnis vorbehalten
+        cerebrum = importlib.import_module("shared_utils.logging_setup").cerebrum
+    cerebrum.remove()
+    cerebrum.add(sys.stderr, level=args.log_level)
+    return {name: importlib.import_module(f"bot_services.{name}") for name in
+            ("gatekeeper_service", "trigger_watcher_service", "athena_engine", "swap_stream_service")}
+
+def _scale_intervals(services: dict, scale: float):
+    for module, names in (
+        (services["gatekeeper_service"], ("POLLING_INTERVAL_SECONDS",)),
+        (services["trigger_watcher_service"], ("POLLING_INTERVAL_SECONDS", "IDLE_INTERVAL_SECONDS")),
+        (services["athena_engine"], ("POLLING_INTERVAL_SECONDS",)),
+        (services["swap_stream_service"], ("WATCHLIST_SYNC_INTERVAL_SECONDS", "RECONNECT_DELAY_SECONDS")),
+    ):
+        for name in names:
+            setattr(module, name, getattr(module, name) * scale)
+
+async def run_benchmark(args, fakes: FakeServices, workdir: str):
+    services = _import_bot(args, workdir)
+    importlib.import_module("database.database_manager").db_manager.firestore_client = fakes.firestore
+    _scale_intervals(services, args.interval_scale)
+    baseline_rss_mb = _peak_rss_mb()
+
+    started_at = fakes.begin_load()
+    tasks = [
+        asyncio.create_task(services["gatekeeper_service"].listen_for_new_pools()),
+        asyncio.create_task(services["trigger_watcher_service"].watch_for_triggers()),
+        asyncio.create_task(services["athena_engine"].manage_positions()),
+        asyncio.create_task(services["swap_stream_service"].stream_swaps_for_watchlist()),
+    ]
+    await asyncio.sleep(args.duration + args.drain)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    bot_peak_rss_mb = _peak_rss_mb()
+    fakes.stop()
+
+    events = fakes.events
+    storm_watchlisted = [t for t in events["pool_created"] if t in events["watchlisted"]]
+    sustained_window = max(events["watchlisted"][t] for t in storm_watchlisted) - started_at if storm_watchlisted else 0
+    exits_due = _exits_due(args, fakes, services["athena_engine"])
+
+    return {
+        "benchmark": "pool_storm",
+        "config": {key: value for key, value in vars(args).items() if key not in ("service_latency", "service_error_rate", "price_path", "output", "log_level")},
+        "pools": {
+            "generated_eligible": len(events["pool_created"]),
+            "watchlisted": len(storm_watchlisted),
+            "missed": len(events["pool_created"]) - len(storm_watchlisted),
+            "sustained_per_second": round(len(storm_watchlisted) / sustained_window, 3) if sustained_window > 0 else 0,
+        },
+        "triggers": {
+            "scheduled": args.watched_tokens,
+            "emitted": len(events["trigger"]),
+            "notifications_dropped": len(events["notification_dropped"]),
+            "bought": len([t for t in events["trigger"] if t in events["buy"]]),
+            "take_profit_due": len(exits_due["take_profit"]),
+            "take_profit_closed": len([t for t in exits_due["take_profit"] if t in events["take_profit"]]),
+            "stop_loss_due": len(exits_due["stop_loss"]),
+            "stop_loss_closed": len([t for t in exits_due["stop_loss"] if t in events["stop_loss"]]),
+        },
+        "latency_ms": {
+            "detection_to_watchlist": _percentiles(_latencies(events["pool_detected"], events["watchlisted"])),
+            "creation_to_watchlist": _percentiles(_latencies(events["pool_created"], events["watchlisted"])),
+            "trigger_to_buy": _percentiles(_latencies(events["trigger"], events["buy"])),
+            "take_profit_reaction": _percentiles(_latencies(exits_due["take_profit"], events["take_profit"])),
+            "stop_loss_reaction": _percentiles(_latencies(exits_due["stop_loss"], events["stop_loss"])),
+        },
+        "memory": {"bot_baseline_rss_mb": baseline_rss_mb, "bot_peak_rss_mb": bot_peak_rss_mb,
+                   "stand_ins_peak_rss_mb": fakes.stand_ins_peak_rss_mb},
+        "services": fakes.stats,
+    }
+
+def main(argv=None):
+    args = parse_args(argv)
+    output = args.output and os.path.abspath(args.output)
+    fakes = FakeServices(args)
+    fakes.start()
+    os.environ.update(fakes.environment())
+    cwd = os.getcwd()
+    workdir = tempfile.TemporaryDirectory(prefix="chimera-bench-")
+    try:
+        result = asyncio.run(run_benchmark(args, fakes, workdir.name))
+    finally:
+        fakes.stop()
+        os.chdir(cwd)
+        workdir.cleanup()
+    report = json.dumps(result, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+if __name__ == "__main__":
+    main()
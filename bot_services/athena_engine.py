@@ -1,6 +1,7 @@
 # bot_services/athena_engine.py (Kompletter Code)
 import asyncio
 import aiohttp
+from config.settings import settings
 from database.database_manager import db_manager
 from shared_utils.logging_setup import cerebrum
 from . import trade_executor
@@ -8,6 +9,7 @@ from . import trade_executor
 # Verkaufsregeln V1.0
 TAKE_PROFIT_PERCENT = 150.0  # +150%
 STOP_LOSS_PERCENT = -50.0   # -50%
+POLLING_INTERVAL_SECONDS = 60
 
 async def manage_positions():
     """Überwacht kontinuierlich alle offenen Positionen und wendet Verkaufsregeln an."""
@@ -30,7 +32,7 @@ async def manage_positions():
                             continue
 
                         # Hole aktuellen Preis
-                        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+                        url = f"{settings.DEXSCREENER_API_URL}/{token_address}"
                         async with session.get(url) as response:
                             if response.status == 200:
                                 data = await response.json()
@@ -47,8 +49,8 @@ async def manage_positions():
                                     elif pnl_percent <= STOP_LOSS_PERCENT:
                                         await trade_executor.execute_simulated_sell(pos, f"Stop Loss ({STOP_LOSS_PERCENT}%) erreicht", pnl_percent)
             
-            await asyncio.sleep(60) # Prüfe alle 60 Sekunden die Positionen
+            await asyncio.sleep(POLLING_INTERVAL_SECONDS) # Prüfe regelmäßig die Positionen
 
         except Exception as e:
             cerebrum.error(f"Fehler in der Athena Engine: {e}")
-            await asyncio.sleep(120)
\ No newline at end of file
+            await asyncio.sleep(POLLING_INTERVAL_SECONDS * 2)
\ No newline at end of file
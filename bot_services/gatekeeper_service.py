@@ -30,6 +30,7 @@ def _parse_pool_info_from_logs(logs):
         unique_keys = list(dict.fromkeys(pubkeys))
         if len(unique_keys) >= 6:
             return {
+                "amm_account": unique_keys[0],
                 "lp_mint": unique_keys[3],
                 "token_a_mint": unique_keys[4],
                 "token_b_mint": unique_keys[5],
@@ -124,7 +125,8 @@ async def listen_for_new_pools():
                 transaction_response = await rpc_client.get_transaction(sig, max_supported_transaction_version=0)
                 transaction = transaction_response.value
 
-                meta = getattr(transaction, 'meta', None)
+                # Die Metadaten (inkl. Logs) liegen eine Ebene tiefer: value.transaction.meta
+                meta = getattr(getattr(transaction, 'transaction', None), 'meta', None)
                 if meta and getattr(meta, 'log_messages', None):
                     logs = meta.log_messages
                     if any("initialize2" in log for log in logs):
@@ -137,8 +139,8 @@ async def listen_for_new_pools():
                                 if pool_info.get("token_a_mint") != SOL_MINT_ADDRESS:
                                     token_address = pool_info.get("token_a_mint")
                                 
-                                token_data = {"address": token_address, "status": "watching", "lp_mint": pool_info.get('lp_mint')}
-                                await db_manager.add_to_hot_watchlist(token_address)
+                                token_data = {"address": token_address, "status": "watching", "lp_mint": pool_info.get('lp_mint'), "amm_account": pool_info.get('amm_account')}
+                                await db_manager.add_to_hot_watchlist(token_address, pool_info.get('amm_account'))
                                 await db_manager.add_to_cold_watchlist(token_data)
                                 
                                 message = (f"✅ **Neuer Token auf Watchlist** ✅\n\n`{token_address}`\n\nDer Token hat die Gatekeeper-Prüfung bestanden und wird jetzt überwacht.")
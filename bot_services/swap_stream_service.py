@@ -0,0 +1,287 @@
+# bot_services/swap_stream_service.py
+import asyncio
+import itertools
+import json
+import time
+from collections import OrderedDict
+import aiohttp
+import websockets
+from solders.signature import Signature
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from config.settings import settings
+from shared_utils.logging_setup import cerebrum
+from database.database_manager import db_manager
+from . import trigger_watcher_service
+
+# Raydium AMM Authority – hält die Pool-Reserven und ist nie der Käufer
+RAYDIUM_AUTHORITY_V4 = "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"
+WATCHLIST_SYNC_INTERVAL_SECONDS = 5
+RECONNECT_DELAY_SECONDS = 5
+# Speichergrenzen: maximale Subscriptions, wartende Swaps und gemerkte Signaturen
+MAX_SUBSCRIPTIONS = 200
+MAX_PENDING_SWAPS = 1000
+MAX_SEEN_SIGNATURES = 5000
+SWAP_WORKER_COUNT = 4
+# Der RPC-Knoten kann dem WebSocket kurz hinterherhinken, bis die Transaktion abrufbar ist
+TRANSACTION_FETCH_ATTEMPTS = 3
+TRANSACTION_RETRY_DELAY_SECONDS = 1
+# Fallback-Suche über DexScreener (bis zu 30 Adressen pro Anfrage) mit Backoff pro Token
+POOL_LOOKUP_BATCH_SIZE = 30
+POOL_LOOKUP_BACKOFF_SECONDS = 30
+MAX_POOL_LOOKUP_BACKOFF_SECONDS = 600
+
+def _extract_buyers(meta, token_address: str):
+    """
+    Ermittelt aus den Token-Salden einer Transaktion alle Wallets,
+    deren Bestand des beobachteten Tokens gestiegen ist.
+    """
+    deltas = {}
+    for balances, sign in ((meta.pre_token_balances or [], -1), (meta.post_token_balances or [], 1)):
+        for balance in balances:
+            if str(balance.mint) != token_address or not balance.owner:
+                continue
+            owner = str(balance.owner)
+            deltas[owner] = deltas.get(owner, 0) + sign * int(balance.ui_token_amount.amount)
+    return [owner for owner, delta in deltas.items() if delta > 0 and owner != RAYDIUM_AUTHORITY_V4]
+
+class SwapStream:
+    """
+    Folgt den AMM-Konten aller Pools der Hot Watchlist per logsSubscribe und meldet
+    Insider/Smart-Money-Käufe ohne Polling-Verzögerung an den Trigger Watcher.
+    """
+
+    def __init__(self, wss_url: str, rpc_url: str, dexscreener_url: str = settings.DEXSCREENER_API_URL):
+        self.wss_url = wss_url
+        self.rpc_url = rpc_url
+        self.dexscreener_url = dexscreener_url
+        self.insiders = set()
+        self.smart_money = set()
+        self.pool_by_token = {}        # token_address -> AMM-Konto (nur Token der Watchlist)
+        self.subscription_by_token = {} # token_address -> Subscription-ID (None = angefragt)
+        self.token_by_subscription = {} # Subscription-ID -> token_address
+        self.pending_requests = {}     # Request-ID -> (Methode, token_address)
+        self.pool_lookup_backoff = {}  # token_address -> (nächster Versuch, aktuelle Wartezeit)
+        self.request_ids = itertools.count(1)
+        self.seen_signatures = OrderedDict()
+        self.swap_queue = asyncio.Queue(maxsize=MAX_PENDING_SWAPS)
+
+    async def _resolve_pools(self, session: aiohttp.ClientSession, token_addresses: list):
+        """
+        Fallback für Token ohne gespeichertes AMM-Konto: sucht die Pools gebündelt
+        über DexScreener und bevorzugt Raydium-Paare.
+        """
+        pools, is_raydium = {}, {}
+        for start in range(0, len(token_addresses), POOL_LOOKUP_BATCH_SIZE):
+            batch = token_addresses[start:start + POOL_LOOKUP_BATCH_SIZE]
+            try:
+                async with session.get(f"{self.dexscreener_url}/{','.join(batch)}") as response:
+                    if response.status != 200:
+                        cerebrum.error(f"DexScreener-Fehler bei Pool-Suche für {len(batch)} Token: Status {response.status}")
+                        continue
+                    data = await response.json()
+            except Exception as e:
+                cerebrum.error(f"Fehler bei der Pool-Suche für {len(batch)} Token: {e}")
+                continue
+            for pair in (data or {}).get("pairs") or []:
+                base, quote = (pair.get("baseToken") or {}).get("address"), (pair.get("quoteToken") or {}).get("address")
+                token_address = base if base in batch else quote if quote in batch else None
+                if not token_address or not pair.get("pairAddress") or is_raydium.get(token_address):
+                    continue
+                pools[token_address] = pair["pairAddress"]
+                is_raydium[token_address] = pair.get("dexId") == "raydium"
+        return pools
+
+    def _lookup_due(self, token_address: str):
+        retry_at, _ = self.pool_lookup_backoff.get(token_address, (0, 0))
+        return time.monotonic() >= retry_at
+
+    def _back_off_lookup(self, token_address: str):
+        _, delay = self.pool_lookup_backoff.get(token_address, (0, 0))
+        delay = min(delay * 2, MAX_POOL_LOOKUP_BACKOFF_SECONDS) if delay else POOL_LOOKUP_BACKOFF_SECONDS
+        self.pool_lookup_backoff[token_address] = (time.monotonic() + delay, delay)
+
+    async def _send(self, ws, method: str, params: list, token_address: str):
+        request_id = next(self.request_ids)
+        self.pending_requests[request_id] = (method, token_address)
+        await ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+
+    async def _subscribe(self, ws, token_address: str, pool_address: str):
+        self.pool_by_token[token_address] = pool_address
+        self.subscription_by_token[token_address] = None
+        await self._send(ws, "logsSubscribe", [{"mentions": [pool_address]}, {"commitment": "confirmed"}], token_address)
+
+    async def _unsubscribe(self, ws, token_address: str):
+        subscription_id = self.subscription_by_token.pop(token_address, None)
+        self.pool_by_token.pop(token_address, None)
+        if subscription_id is not None:
+            self.token_by_subscription.pop(subscription_id, None)
+            await self._send(ws, "logsUnsubscribe", [subscription_id], token_address)
+
+    async def _sync_round(self, ws, session: aiohttp.ClientSession):
+        watchlist = await db_manager.get_hot_watchlist()
+        if len(watchlist) > MAX_SUBSCRIPTIONS:
+            cerebrum.warning(f"Hot Watchlist ({len(watchlist)}) übersteigt das Limit von {MAX_SUBSCRIPTIONS} Swap-Subscriptions.")
+        wanted = set(watchlist[:MAX_SUBSCRIPTIONS])
+
+        for token_address in [t for t in self.subscription_by_token if t not in wanted]:
+            await self._unsubscribe(ws, token_address)
+            cerebrum.debug(f"Swap-Subscription für {token_address[:6]}... beendet.")
+        for token_address in [t for t in self.pool_lookup_backoff if t not in wanted]:
+            del self.pool_lookup_backoff[token_address]
+
+        # Das AMM-Konto hat der Gatekeeper beim Eintrag in die Watchlist gespeichert
+        stored_pools = await db_manager.get_hot_watchlist_pools()
+        unresolved = []
+        for token_address in wanted:
+            if token_address in self.subscription_by_token:
+                continue
+            pool_address = self.pool_by_token.get(token_address) or stored_pools.get(token_address)
+            if pool_address:
+                await self._subscribe(ws, token_address, pool_address)
+            elif self._lookup_due(token_address):
+                unresolved.append(token_address)
+
+        if unresolved:
+            resolved = await self._resolve_pools(session, unresolved)
+            for token_address in unresolved:
+                if token_address in resolved:
+                    self.pool_lookup_backoff.pop(token_address, None)
+                    await self._subscribe(ws, token_address, resolved[token_address])
+                else:
+                    self._back_off_lookup(token_address) # DexScreener kennt den Pool evtl. noch nicht
+
+    async def _sync_watchlist(self, ws):
+        """Gleicht die Subscriptions periodisch mit der Hot Watchlist ab."""
+        async with aiohttp.ClientSession() as session:
+            while True:
+                await self._sync_round(ws, session)
+                await asyncio.sleep(WATCHLIST_SYNC_INTERVAL_SECONDS)
+
+    async def _handle_message(self, ws, message: dict):
+        if "id" in message:
+            method, token_address = self.pending_requests.pop(message["id"], (None, None))
+            if method != "logsSubscribe":
+                return
+            subscription_id = message.get("result")
+            if "error" in message or subscription_id is None:
+                cerebrum.error(f"Swap-Subscription für {token_address} fehlgeschlagen: {message.get('error')}")
+                if token_address in self.subscription_by_token and self.subscription_by_token[token_address] is None:
+                    del self.subscription_by_token[token_address] # Nächste Sync-Runde versucht es erneut
+            elif token_address in self.subscription_by_token and self.subscription_by_token[token_address] is None:
+                self.subscription_by_token[token_address] = subscription_id
+                self.token_by_subscription[subscription_id] = token_address
+                cerebrum.info(f"Swap-Subscription für {token_address[:6]}... aktiv.")
+            else:
+                # Token wurde entfernt, bevor die Subscription bestätigt war
+                await self._send(ws, "logsUnsubscribe", [subscription_id], token_address)
+            return
+
+        if message.get("method") != "logsNotification":
+            return
+        params = message.get("params", {})
+        token_address = self.token_by_subscription.get(params.get("subscription"))
+        value = params.get("result", {}).get("value", {})
+        signature = value.get("signature")
+        if not token_address or not signature or value.get("err") is not None:
+            return
+        if signature in self.seen_signatures:
+            return
+        self.seen_signatures[signature] = None
+        if len(self.seen_signatures) > MAX_SEEN_SIGNATURES:
+            self.seen_signatures.popitem(last=False)
+        try:
+            self.swap_queue.put_nowait((token_address, signature))
+        except asyncio.QueueFull:
+            cerebrum.warning(f"Swap-Queue voll, verwerfe Swap {signature[:8]}... für {token_address[:6]}...")
+
+    async def _fetch_meta(self, rpc_client: AsyncClient, signature: str):
+        """
+        Lädt die Metadaten eines Swaps mit derselben Commitment-Stufe wie die Subscription.
+        Mit dem Standard (finalized) liefert der Knoten für gerade bestätigte Swaps noch `null`.
+        """
+        for attempt in range(1, TRANSACTION_FETCH_ATTEMPTS + 1):
+            transaction_response = await rpc_client.get_transaction(
+                Signature.from_string(signature), commitment=Confirmed, max_supported_transaction_version=0)
+            # Die Metadaten liegen eine Ebene tiefer: value.transaction.meta
+            meta = getattr(getattr(transaction_response.value, 'transaction', None), 'meta', None)
+            if meta:
+                return meta
+            if attempt < TRANSACTION_FETCH_ATTEMPTS:
+                await asyncio.sleep(TRANSACTION_RETRY_DELAY_SECONDS)
+        cerebrum.debug(f"Swap {signature[:8]}... nach {TRANSACTION_FETCH_ATTEMPTS} Versuchen nicht abrufbar, übersprungen.")
+        return None
+
+    async def _process_swaps(self, rpc_client: AsyncClient):
+        """Dekodiert den Käufer jedes Swaps und meldet spezielle Wallets an den Trigger Watcher."""
+        while True:
+            token_address, signature = await self.swap_queue.get()
+            try:
+                meta = await self._fetch_meta(rpc_client, signature)
+                if not meta:
+                    continue
+                best_trigger, best_bonus, best_buyer = None, 0, None
+                for buyer in _extract_buyers(meta, token_address):
+                    trigger, tas_bonus = trigger_watcher_service.classify_buyer(buyer, self.insiders, self.smart_money)
+                    if tas_bonus > best_bonus:
+                        best_trigger, best_bonus, best_buyer = trigger, tas_bonus, buyer
+                if best_trigger:
+                    await trigger_watcher_service.on_special_wallet_buy(token_address, best_buyer, best_trigger, best_bonus)
+            except Exception as e:
+                cerebrum.error(f"Fehler beim Dekodieren des Swaps {signature}: {e}")
+            finally:
+                self.swap_queue.task_done()
+
+    async def _read_messages(self, ws):
+        async for raw_message in ws:
+            try:
+                message = json.loads(raw_message)
+            except ValueError:
+                continue
+            await self._handle_message(ws, message)
+
+    async def _run_connection(self):
+        async with websockets.connect(self.wss_url, ping_interval=20) as ws:
+            cerebrum.info("Swap-Stream mit dem Solana WebSocket verbunden.")
+            tasks = [asyncio.create_task(self._read_messages(ws)), asyncio.create_task(self._sync_watchlist(ws))]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                # Auch bei Abbruch von außen dürfen Leser und Sync nicht am geschlossenen Socket weiterlaufen
+                for task in tasks:
+                    task.cancel()
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result # run() protokolliert den Fehler und verbindet neu
+
+    def _reset_subscriptions(self):
+        # Subscriptions gelten nur für eine Verbindung und werden nach dem Reconnect neu angelegt
+        self.subscription_by_token.clear()
+        self.token_by_subscription.clear()
+        self.pending_requests.clear()
+
+    async def run(self):
+        self.insiders, self.smart_money = await db_manager.load_special_wallets()
+        rpc_client = AsyncClient(self.rpc_url)
+        workers = [asyncio.create_task(self._process_swaps(rpc_client)) for _ in range(SWAP_WORKER_COUNT)]
+        try:
+            while True:
+                try:
+                    await self._run_connection()
+                    cerebrum.warning("Swap-Stream-Verbindung geschlossen. Verbinde neu...")
+                except Exception as e:
+                    cerebrum.error(f"Fehler im Swap-Stream: {e}")
+                self._reset_subscriptions()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await rpc_client.close()
+
+async def stream_swaps_for_watchlist():
+    if not settings.QUICKNODE_WSS_URL:
+        cerebrum.warning("QUICKNODE_WSS_URL nicht gesetzt – Swap-Stream für Insider/Smart-Money-Erkennung deaktiviert.")
+        return
+    cerebrum.info("Swap-Stream Service gestartet.")
+    await SwapStream(settings.QUICKNODE_WSS_URL, settings.QUICKNODE_RPC_URL).run()
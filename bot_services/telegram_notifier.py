@@ -6,7 +6,7 @@ async def send_telegram_message(message: str):
     """
     Sendet eine formatierte Nachricht an den konfigurierten Telegram-Chat.
     """
-    url = f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
+    url = f"{settings.TELEGRAM_API_URL}/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
     payload = {
         "chat_id": settings.TELEGRAM_CHAT_ID,
         "text": message,
@@ -1,6 +1,7 @@
 # bot_services/trade_executor.py (Kompletter Code)
 from datetime import datetime, timezone
 import aiohttp
+from config.settings import settings
 from database.database_manager import db_manager
 from shared_utils.logging_setup import cerebrum
 from .telegram_notifier import send_telegram_message
@@ -10,7 +11,7 @@ async def execute_simulated_buy(token_address: str, investment_usd: int, mqs: in
     entry_price = 0
     try:
         async with aiohttp.ClientSession() as session:
-            url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+            url = f"{settings.DEXSCREENER_API_URL}/{token_address}"
             async with session.get(url) as response:
                 if response.status == 200:
                     data = await response.json()
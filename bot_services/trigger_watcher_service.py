@@ -1,4 +1,6 @@
 import asyncio
+import time
+from collections import OrderedDict
 import aiohttp
 from config.settings import settings
 from shared_utils.logging_setup import cerebrum
@@ -11,6 +13,21 @@ MQS_BENCHMARK_VOLUME_H1 = 10000
 MQS_BENCHMARK_TX_H24 = 500
 # TAS-Schwelle zur Aktivierung von ScoreX
 TAS_SCOREX_THRESHOLD = 4
+POLLING_INTERVAL_SECONDS = 60
+IDLE_INTERVAL_SECONDS = 15
+# TAS-Boni für Käufe spezieller Wallets
+INSIDER_TAS_BONUS = 4 # Insider-Käufe geben den höchsten TAS-Bonus
+SMART_MONEY_TAS_BONUS = 3
+# Wie lange ein vom Swap-Stream gemeldeter Kauf in die TAS-Berechnung einfließt
+SPECIAL_BUY_TTL_SECONDS = 600
+MAX_TRACKED_SPECIAL_BUYS = 500
+
+# Vom Swap-Stream gemeldete Käufe je Token: token_address -> (trigger, tas_bonus, zeitpunkt)
+_recent_special_buys = OrderedDict()
+# Token, die gerade bewertet werden (verhindert Doppelkäufe zwischen Polling und Swap-Stream)
+_tokens_in_evaluation = set()
+# Während einer laufenden Bewertung eingetroffene Anfragen: token_address -> neueste pair_data
+_pending_reevaluations = {}
 
 def _calculate_mqs(pair_data: dict):
     if not pair_data: return 0
@@ -28,74 +45,128 @@ def _calculate_mqs(pair_data: dict):
         cerebrum.error(f"Fehler bei MQS-Berechnung: {e}")
         return 0
 
-def _check_for_special_wallet_activity(pair_data: dict, insiders: set, smart_money: set):
-    recent_txns = pair_data.get("transactions", [])
-    if not recent_txns: return None, 0
-    for txn in recent_txns:
-        if txn.get('txType') == 'buy':
-            buyer = txn.get('maker', {}).get('address')
-            if buyer:
-                if buyer in insiders:
-                    cerebrum.info(f"INSIDER-KAUF entdeckt von {buyer[:6]}...")
-                    return "Insider Buy", 4 # Insider-Käufe geben den höchsten TAS-Bonus
-                if buyer in smart_money:
-                    cerebrum.info(f"SMART MONEY-KAUF entdeckt von {buyer[:6]}...")
-                    return "Smart Money Buy", 3
+def classify_buyer(buyer: str, insiders: set, smart_money: set):
+    """Ordnet einen Käufer den speziellen Wallet-Listen zu und liefert Trigger und TAS-Bonus."""
+    if buyer in insiders:
+        return "Insider Buy", INSIDER_TAS_BONUS
+    if buyer in smart_money:
+        return "Smart Money Buy", SMART_MONEY_TAS_BONUS
     return None, 0
 
+def record_special_wallet_buy(token_address: str, trigger: str, tas_bonus: int):
+    """Merkt sich einen Insider/Smart-Money-Kauf, damit auch die nächsten Polling-Runden den Bonus sehen."""
+    previous = _recent_special_buys.pop(token_address, None)
+    if previous and previous[1] > tas_bonus and time.monotonic() - previous[2] < SPECIAL_BUY_TTL_SECONDS:
+        trigger, tas_bonus = previous[0], previous[1]
+    _recent_special_buys[token_address] = (trigger, tas_bonus, time.monotonic())
+    while len(_recent_special_buys) > MAX_TRACKED_SPECIAL_BUYS:
+        _recent_special_buys.popitem(last=False)
+
+def _check_for_special_wallet_activity(token_address: str):
+    entry = _recent_special_buys.get(token_address)
+    if not entry: return None, 0
+    trigger, tas_bonus, seen_at = entry
+    if time.monotonic() - seen_at > SPECIAL_BUY_TTL_SECONDS:
+        del _recent_special_buys[token_address]
+        return None, 0
+    return trigger, tas_bonus
+
+async def _fetch_pair_data(session: aiohttp.ClientSession, token_address: str):
+    url = f"{settings.DEXSCREENER_API_URL}/{token_address}"
+    async with session.get(url) as response:
+        if response.status == 200:
+            data = await response.json()
+            if data and data.get("pairs"):
+                return data["pairs"][0]
+        else:
+            cerebrum.error(f"DexScreener-Fehler für {token_address}: Status {response.status}")
+    return None
+
+async def _score_and_trade(token_address: str, pair_data: dict):
+    """Berechnet den TAS und aktiviert bei Erreichen der Schwelle ScoreX und den Kauf. Gibt True nach einem Kauf zurück."""
+    # 1. Berechne TAS als schneller Filter
+    tas = 0
+    mqs = _calculate_mqs(pair_data)
+    if mqs > 75: tas += 2
+
+    db_trigger, db_tas_bonus = _check_for_special_wallet_activity(token_address)
+    tas += db_tas_bonus
+
+    cerebrum.info(f"Token: {token_address[:6]}... | MQS: {mqs} | TAS: {tas}")
+
+    # 2. TAS-Schwelle prüfen ("Türsteher")
+    if tas >= TAS_SCOREX_THRESHOLD:
+        cerebrum.success(f"!! TAS-SCHWELLE ERREICHT !! Token: {token_address}, TAS: {tas}. Aktiviere ScoreX...")
+
+        # 3. ScoreX aktivieren ("VIP-Manager")
+        final_score, category = await scorex_engine.run_final_analysis(token_address, mqs)
+
+        # 4. Finale Entscheidung basierend auf ScoreX
+        if category != "Kein Trade":
+            investment_usd = 0
+            if category == "Konfidenz-Trade": investment_usd = 25
+            elif category == "Hochkonfidenz-Trade": investment_usd = 40
+
+            # Ein paralleler Pfad kann den Token inzwischen gekauft und entfernt haben
+            if investment_usd > 0 and await db_manager.is_on_hot_watchlist(token_address):
+                await trade_executor.execute_simulated_buy(token_address, investment_usd, mqs, final_score, category)
+                await db_manager.remove_from_hot_watchlist(token_address)
+                _recent_special_buys.pop(token_address, None)
+                return True
+    return False
+
+async def _evaluate_token(token_address: str, pair_data: dict):
+    """
+    Bewertet einen Token, höchstens einmal gleichzeitig. Trifft währenddessen eine weitere
+    Anfrage ein (z.B. ein Insider-Kauf während der ScoreX-Abfrage des Pollers), bewertet
+    der laufende Aufruf danach erneut, statt die Anfrage zu verwerfen.
+    """
+    if token_address in _tokens_in_evaluation:
+        _pending_reevaluations[token_address] = pair_data
+        return
+    _tokens_in_evaluation.add(token_address)
+    try:
+        while pair_data is not None:
+            if await _score_and_trade(token_address, pair_data):
+                break
+            pair_data = _pending_reevaluations.pop(token_address, None)
+    finally:
+        _pending_reevaluations.pop(token_address, None)
+        _tokens_in_evaluation.discard(token_address)
+
+async def on_special_wallet_buy(token_address: str, buyer: str, trigger: str, tas_bonus: int):
+    """
+    Einstiegspunkt für den Swap-Stream: bewertet den Token sofort, statt auf die nächste Polling-Runde zu warten.
+    """
+    cerebrum.info(f"{trigger.upper()} entdeckt von {buyer[:6]}... auf {token_address[:6]}...")
+    record_special_wallet_buy(token_address, trigger, tas_bonus)
+    try:
+        async with aiohttp.ClientSession() as session:
+            pair_data = await _fetch_pair_data(session, token_address)
+        if pair_data:
+            await _evaluate_token(token_address, pair_data)
+    except Exception as e:
+        cerebrum.error(f"Fehler bei der Sofort-Bewertung von {token_address}: {e}")
+
 async def watch_for_triggers():
     cerebrum.info("Trigger Watcher Service gestartet.")
-    insiders, smart_money = await db_manager.load_special_wallets()
     
     while True:
         try:
             watchlist = await db_manager.get_hot_watchlist()
             if not watchlist:
-                await asyncio.sleep(15)
+                await asyncio.sleep(IDLE_INTERVAL_SECONDS)
                 continue
             
             cerebrum.info(f"Überwache {len(watchlist)} Token auf der Hot Watchlist...")
 
             async with aiohttp.ClientSession() as session:
                 for token_address in watchlist:
-                    url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if data and data.get("pairs"):
-                                pair_data = data["pairs"][0]
-                                
-                                # ## NEUE TAS & SCOREX LOGIK ##
-                                # 1. Berechne TAS als schneller Filter
-                                tas = 0
-                                mqs = _calculate_mqs(pair_data)
-                                if mqs > 75: tas += 2
-                                
-                                db_trigger, db_tas_bonus = _check_for_special_wallet_activity(pair_data, insiders, smart_money)
-                                tas += db_tas_bonus
-                                
-                                cerebrum.info(f"Token: {token_address[:6]}... | MQS: {mqs} | TAS: {tas}")
-
-                                # 2. TAS-Schwelle prüfen ("Türsteher")
-                                if tas >= TAS_SCOREX_THRESHOLD:
-                                    cerebrum.success(f"!! TAS-SCHWELLE ERREICHT !! Token: {token_address}, TAS: {tas}. Aktiviere ScoreX...")
-                                    
-                                    # 3. ScoreX aktivieren ("VIP-Manager")
-                                    final_score, category = await scorex_engine.run_final_analysis(token_address, mqs)
-                                    
-                                    # 4. Finale Entscheidung basierend auf ScoreX
-                                    if category != "Kein Trade":
-                                        investment_usd = 0
-                                        if category == "Konfidenz-Trade": investment_usd = 25
-                                        elif category == "Hochkonfidenz-Trade": investment_usd = 40
-                                        
-                                        if investment_usd > 0:
-                                            await trade_executor.execute_simulated_buy(token_address, investment_usd, mqs, final_score, category)
-                                            await db_manager.remove_from_hot_watchlist(token_address)
-                        else:
-                            cerebrum.error(f"DexScreener-Fehler für {token_address}: Status {response.status}")
+                    pair_data = await _fetch_pair_data(session, token_address)
+                    if pair_data:
+                        await _evaluate_token(token_address, pair_data)
             
-            await asyncio.sleep(60)
+            await asyncio.sleep(POLLING_INTERVAL_SECONDS)
         except Exception as e:
             cerebrum.critical(f"Kritischer Fehler im Trigger Watcher: {e}")
-            await asyncio.sleep(60)
\ No newline at end of file
+            await asyncio.sleep(POLLING_INTERVAL_SECONDS)
@@ -30,7 +30,10 @@ class Settings:
     # Static config - no longer check for these as they are not used on the server
     QUICKNODE_WSS_URL: str = os.getenv("QUICKNODE_WSS_URL", "") # Optional
     
-    DEXSCREENER_API_URL: str = "https://api.dexscreener.com/latest/dex/tokens"
-    GOPLUS_API_URL: str = "https://api.gopluslabs.io/api/v1/token_security/1"
+    # Externe APIs - per Umgebungsvariable überschreibbar (z.B. für die lokalen Benchmark-Server)
+    DEXSCREENER_API_URL: str = os.getenv("DEXSCREENER_API_URL", "https://api.dexscreener.com/latest/dex/tokens")
+    GOPLUS_API_URL: str = os.getenv("GOPLUS_API_URL", "https://api.gopluslabs.io/api/v1/token_security/1")
+    COINGECKO_API_URL: str = os.getenv("COINGECKO_API_URL", "https://api.coingecko.com/api/v3/simple/price")
+    TELEGRAM_API_URL: str = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org")
 
 settings = Settings()
\ No newline at end of file
@@ -63,16 +63,28 @@ class DatabaseManager:
             cerebrum.error(f"Fehler beim Laden der speziellen Wallets: {e}")
             return set(), set()
             
-    async def add_to_hot_watchlist(self, token_address: str):
+    async def add_to_hot_watchlist(self, token_address: str, pool_address: str = None):
         if not self.redis_client: return
-        try: await self.redis_client.sadd("hot_watchlist", token_address)
+        try:
+            # AMM-Konto aus den initialize2-Logs merken, damit der Swap-Stream nicht nachschlagen muss
+            if pool_address: await self.redis_client.hset("hot_watchlist_pools", token_address, pool_address)
+            await self.redis_client.sadd("hot_watchlist", token_address)
         except Exception as e: cerebrum.error(f"Fehler bei Redis: {e}")
 
     async def remove_from_hot_watchlist(self, token_address: str):
         if not self.redis_client: return
-        try: await self.redis_client.srem("hot_watchlist", token_address)
+        try:
+            await self.redis_client.srem("hot_watchlist", token_address)
+            await self.redis_client.hdel("hot_watchlist_pools", token_address)
         except Exception as e: cerebrum.error(f"Fehler bei Redis: {e}")
 
+    async def is_on_hot_watchlist(self, token_address: str):
+        if not self.redis_client: return False
+        try: return bool(await self.redis_client.sismember("hot_watchlist", token_address))
+        except Exception as e:
+            cerebrum.error(f"Fehler bei Redis: {e}")
+            return False
+
     async def add_to_cold_watchlist(self, token_data: dict):
         if not self.firestore_client: return
         try:
@@ -91,6 +103,13 @@ class DatabaseManager:
             cerebrum.error(f"Fehler beim Lesen der Hot Watchlist: {e}")
             return []
 
+    async def get_hot_watchlist_pools(self):
+        if not self.redis_client: return {}
+        try: return await self.redis_client.hgetall("hot_watchlist_pools")
+        except Exception as e:
+            cerebrum.error(f"Fehler beim Lesen der Watchlist-Pools: {e}")
+            return {}
+
     async def add_open_position(self, trade_data: dict):
         if not self.firestore_client: return
         try:
@@ -3,6 +3,7 @@ from shared_utils.logging_setup import cerebrum
 from bot_services.gatekeeper_service import listen_for_new_pools
 from bot_services.trigger_watcher_service import watch_for_triggers # ## NEUER IMPORT ##
 from bot_services.athena_engine import manage_positions # ## NEUER IMPORT ##
+from bot_services.swap_stream_service import stream_swaps_for_watchlist
 
 async def main():
     """
@@ -20,8 +21,9 @@ async def main():
         gatekeeper_task = asyncio.create_task(listen_for_new_pools())
         trigger_watcher_task = asyncio.create_task(watch_for_triggers()) # ## NEUER TASK ##
         athena_task = asyncio.create_task(manage_positions()) # ## NEUER TASK ##
+        swap_stream_task = asyncio.create_task(stream_swaps_for_watchlist())
 
-        await asyncio.gather(gatekeeper_task, trigger_watcher_task, athena_task) # ## AKTUALISIERT ##
+        await asyncio.gather(gatekeeper_task, trigger_watcher_task, athena_task, swap_stream_task)
         
     except KeyboardInterrupt:
         cerebrum.warning("Bot wird manuell heruntergefahren.")
@@ -0,0 +1,23 @@
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Settings verlangt alle Secrets; für die Tests reichen Platzhalter (Redis verbindet erst bei Bedarf)
+for key in ("QUICKNODE_RPC_URL", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID", "GOOGLE_CLOUD_PROJECT", "GOOGLE_CREDENTIALS_BASE64"):
+    os.environ.setdefault(key, "test")
+os.environ.setdefault("UPSTASH_REDIS_URL", "redis://127.0.0.1:1/0")
+os.environ.setdefault("REDIS_URL", "redis://127.0.0.1:1/0")
+
+# Cerebrum schreibt beim Import nach logs/bot_activity.log - nicht in die Log-Datei des Repositorys
+_log_dir = tempfile.TemporaryDirectory(prefix="chimera-tests-")
+_cwd = os.getcwd()
+os.chdir(_log_dir.name)
+try:
+    from shared_utils.logging_setup import cerebrum
+    cerebrum.remove()
+    cerebrum.add(sys.stderr, level="WARNING")
+finally:
+    os.chdir(_cwd)
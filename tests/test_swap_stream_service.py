@@ -0,0 +1,166 @@
+import asyncio
+import json
+import aiohttp
+from aiohttp import web
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solana.rpc.async_api import AsyncClient
+from bot_services import swap_stream_service, trigger_watcher_service
+from bot_services.swap_stream_service import SwapStream, RAYDIUM_AUTHORITY_V4
+
+TOKEN = str(Pubkey.new_unique())
+INSIDER = str(Pubkey.new_unique())
+
+def _token_balance(owner, account_index, amount):
+    return {"accountIndex": account_index, "mint": TOKEN, "owner": owner, "programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+            "uiTokenAmount": {"amount": str(amount), "decimals": 6, "uiAmount": amount / 1e6, "uiAmountString": str(amount / 1e6)}}
+
+def _swap_transaction(signature):
+    """getTransaction-Ergebnis eines Swaps, bei dem INSIDER den Token kauft."""
+    account_keys = [INSIDER, str(Pubkey.new_unique()), str(Pubkey.new_unique())]
+    return {
+        "slot": 1, "blockTime": 1, "version": 0,
+        "transaction": {"signatures": [signature], "message": {
+            "header": {"numRequiredSignatures": 1, "numReadonlySignedAccounts": 0, "numReadonlyUnsignedAccounts": 1},
+            "accountKeys": account_keys, "recentBlockhash": str(Pubkey.new_unique()),
+            "instructions": [{"programIdIndex": 2, "accounts": [0, 1], "data": "", "stackHeight": None}],
+            "addressTableLookups": []}},
+        "meta": {"err": None, "status": {"Ok": None}, "fee": 5000, "preBalances": [0, 0, 0], "postBalances": [0, 0, 0],
+                 "innerInstructions": [], "logMessages": ["Program log: ray_log: swap"],
+                 "preTokenBalances": [_token_balance(INSIDER, 1, 0), _token_balance(RAYDIUM_AUTHORITY_V4, 2, 10**12)],
+                 "postTokenBalances": [_token_balance(INSIDER, 1, 5 * 10**9), _token_balance(RAYDIUM_AUTHORITY_V4, 2, 10**12 - 5 * 10**9)],
+                 "rewards": [], "loadedAddresses": {"writable": [], "readonly": []}, "computeUnitsConsumed": 1000},
+    }
+
+async def _start_fake_rpc(transactions, lagging_reads=None):
+    """
+    getTransaction-Stand-in: Swaps sind nur bestätigt, nicht finalisiert - ohne
+    `commitment: confirmed` antwortet der Knoten wie in Produktion mit `null`.
+    `lagging_reads` zählt pro Signatur Abfragen, die noch vor dem Knoten-Sync ankommen.
+    """
+    lagging_reads = lagging_reads if lagging_reads is not None else {}
+
+    async def rpc(request):
+        body = await request.json()
+        result = None
+        if body["method"] == "getTransaction":
+            signature, config = body["params"][0], body["params"][1] if len(body["params"]) > 1 else {}
+            if lagging_reads.get(signature):
+                lagging_reads[signature] -= 1
+            elif config.get("commitment") == "confirmed":
+                result = transactions.get(signature)
+        return web.json_response({"jsonrpc": "2.0", "id": body["id"], "result": result})
+
+    app = web.Application()
+    app.router.add_post("/", rpc)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}/"
+
+def _run_insider_swap(monkeypatch, lagging_reads=None):
+    signature = str(Signature.new_unique())
+    reported = []
+
+    async def record(token_address, buyer, trigger, tas_bonus):
+        reported.append((token_address, buyer, trigger, tas_bonus))
+
+    monkeypatch.setattr(trigger_watcher_service, "on_special_wallet_buy", record)
+
+    async def scenario():
+        runner, rpc_url = await _start_fake_rpc({signature: _swap_transaction(signature)},
+                                                {signature: lagging_reads} if lagging_reads else None)
+        rpc_client = AsyncClient(rpc_url)
+        stream = SwapStream("ws://unused", rpc_url)
+        stream.insiders = {INSIDER}
+        worker = asyncio.create_task(stream._process_swaps(rpc_client))
+        try:
+            # Subscription-Bestätigung, dann dieselbe Benachrichtigung zweimal (Duplikat wird verworfen)
+            stream.subscription_by_token[TOKEN] = None
+            stream.pending_requests[1] = ("logsSubscribe", TOKEN)
+            await stream._handle_message(None, {"jsonrpc": "2.0", "id": 1, "result": 7})
+            notification = {"jsonrpc": "2.0", "method": "logsNotification", "params": {
+                "subscription": 7, "result": {"value": {"signature": signature, "err": None, "logs": []}}}}
+            await stream._handle_message(None, notification)
+            await stream._handle_message(None, notification)
+            await asyncio.wait_for(stream.swap_queue.join(), timeout=5)
+        finally:
+            worker.cancel()
+            await rpc_client.close()
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+    return reported
+
+def test_notification_is_decoded_into_insider_buy(monkeypatch):
+    reported = _run_insider_swap(monkeypatch)
+    assert reported == [(TOKEN, INSIDER, "Insider Buy", trigger_watcher_service.INSIDER_TAS_BONUS)]
+
+def test_swap_is_retried_while_rpc_node_lags(monkeypatch):
+    monkeypatch.setattr(swap_stream_service, "TRANSACTION_RETRY_DELAY_SECONDS", 0)
+    reported = _run_insider_swap(monkeypatch, lagging_reads=swap_stream_service.TRANSACTION_FETCH_ATTEMPTS - 1)
+    assert reported == [(TOKEN, INSIDER, "Insider Buy", trigger_watcher_service.INSIDER_TAS_BONUS)]
+
+def test_failed_transactions_are_ignored():
+    stream = SwapStream("ws://unused", "http://unused")
+    stream.token_by_subscription[7] = TOKEN
+    notification = {"method": "logsNotification", "params": {
+        "subscription": 7, "result": {"value": {"signature": str(Signature.new_unique()), "err": {"InstructionError": []}, "logs": []}}}}
+    asyncio.run(stream._handle_message(None, notification))
+    assert stream.swap_queue.empty()
+
+def test_extract_buyers_skips_pool_authority():
+    meta = _swap_transaction(str(Signature.new_unique()))["meta"]
+
+    class Balance:
+        def __init__(self, raw):
+            self.mint, self.owner = raw["mint"], raw["owner"]
+            self.ui_token_amount = type("Amount", (), {"amount": raw["uiTokenAmount"]["amount"]})
+
+    class Meta:
+        pre_token_balances = [Balance(b) for b in meta["preTokenBalances"]]
+        post_token_balances = [Balance(b) for b in meta["postTokenBalances"]]
+
+    assert swap_stream_service._extract_buyers(Meta, TOKEN) == [INSIDER]
+
+def test_sync_uses_stored_pools_and_batches_dexscreener_lookups(monkeypatch):
+    stored, listed, unknown = (str(Pubkey.new_unique()) for _ in range(3))
+    stored_pool, listed_pool = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+    lookups, subscribed = [], []
+
+    async def get_hot_watchlist():
+        return [stored, listed, unknown]
+
+    async def get_hot_watchlist_pools():
+        return {stored: stored_pool}
+
+    monkeypatch.setattr(swap_stream_service.db_manager, "get_hot_watchlist", get_hot_watchlist)
+    monkeypatch.setattr(swap_stream_service.db_manager, "get_hot_watchlist_pools", get_hot_watchlist_pools)
+
+    class FakeWebSocket:
+        async def send(self, raw_message):
+            subscribed.append(json.loads(raw_message)["params"][0]["mentions"][0])
+
+    async def dexscreener(request):
+        lookups.append(request.match_info["tokens"].split(","))
+        return web.json_response({"pairs": [{"dexId": "raydium", "pairAddress": listed_pool, "baseToken": {"address": listed}}]})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/tokens/{tokens}", dexscreener)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        stream = SwapStream("ws://unused", "http://unused", f"http://127.0.0.1:{runner.addresses[0][1]}/tokens")
+        try:
+            async with aiohttp.ClientSession() as session:
+                await stream._sync_round(FakeWebSocket(), session)
+                await stream._sync_round(FakeWebSocket(), session) # unbekannter Token ist im Backoff
+        finally:
+            await runner.cleanup()
+        return stream
+
+    stream = asyncio.run(scenario())
+    assert sorted(subscribed) == sorted([stored_pool, listed_pool])
+    assert len(lookups) == 1 and sorted(lookups[0]) == sorted([listed, unknown])
+    assert list(stream.pool_lookup_backoff) == [unknown]
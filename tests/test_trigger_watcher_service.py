@@ -0,0 +1,31 @@
+import asyncio
+from bot_services import trigger_watcher_service
+
+TOKEN = "TestToken1111111111111111111111111111111111"
+HOT_PAIR = {"txns": {"h24": {"buys": 900, "sells": 100}}, "volume": {"h1": 50000}}
+
+def test_special_buy_during_evaluation_triggers_reevaluation(monkeypatch):
+    analyses = []
+    gate = {}
+
+    async def slow_analysis(token_address, mqs):
+        analyses.append(trigger_watcher_service._check_for_special_wallet_activity(token_address))
+        await gate["released"].wait()
+        return 50, "Kein Trade"
+
+    monkeypatch.setattr(trigger_watcher_service.scorex_engine, "run_final_analysis", slow_analysis)
+
+    async def scenario():
+        gate["released"] = asyncio.Event()
+        trigger_watcher_service.record_special_wallet_buy(TOKEN, "Smart Money Buy", trigger_watcher_service.SMART_MONEY_TAS_BONUS)
+        poller = asyncio.create_task(trigger_watcher_service._evaluate_token(TOKEN, HOT_PAIR))
+        await asyncio.sleep(0) # Poller hängt jetzt in ScoreX
+        trigger_watcher_service.record_special_wallet_buy(TOKEN, "Insider Buy", trigger_watcher_service.INSIDER_TAS_BONUS)
+        await trigger_watcher_service._evaluate_token(TOKEN, HOT_PAIR)
+        gate["released"].set()
+        await asyncio.wait_for(poller, timeout=5)
+
+    asyncio.run(scenario())
+    assert analyses == [("Smart Money Buy", 3), ("Insider Buy", 4)]
+    assert TOKEN not in trigger_watcher_service._tokens_in_evaluation
+    assert TOKEN not in trigger_watcher_service._pending_reevaluations